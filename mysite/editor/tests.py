@@ -5,6 +5,8 @@ import json
 from django.test import Client, TestCase
 from django.urls import reverse
 
+from editor.views import full_html_document
+
 
 class EditorViewsTests(TestCase):
     def setUp(self) -> None:
@@ -44,6 +46,74 @@ class EditorViewsTests(TestCase):
         self.assertIn("document", payload["html"])
         self.assertIn(".document", payload["css"])
 
+    def test_preview_css_omits_unused_blocks(self) -> None:
+        payload = dict(self.sample_payload, markdown="문단 하나뿐인 문서입니다.")
+        response = self.client.post(
+            reverse("editor:preview"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        css = response.json()["css"]
+        self.assertIn(".document", css)
+        self.assertNotIn(".document table", css)
+        self.assertNotIn(".document blockquote", css)
+        self.assertNotIn(".document code", css)
+
+    def test_preview_css_includes_used_blocks(self) -> None:
+        response = self.client.post(
+            reverse("editor:preview"),
+            data=json.dumps(self.sample_payload),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        css = response.json()["css"]
+        self.assertIn(".document blockquote", css)
+        self.assertIn(".document code", css)
+        self.assertIn(".document ul", css)
+
+    def test_preview_returns_304_for_matching_etag(self) -> None:
+        data = json.dumps(self.sample_payload)
+        first = self.client.post(
+            reverse("editor:preview"), data=data, content_type="application/json"
+        )
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        second = self.client.post(
+            reverse("editor:preview"),
+            data=data,
+            content_type="application/json",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(second.status_code, 304)
+
+    def test_preview_renders_tables(self) -> None:
+        payload = dict(
+            self.sample_payload,
+            markdown="| 항목 | 값 |\n| --- | --- |\n| 하나 | 1 |",
+        )
+        response = self.client.post(
+            reverse("editor:preview"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertIn("<table>", body["html"])
+        self.assertIn(".document table", body["css"])
+
+    def test_pdf_document_title_is_escaped(self) -> None:
+        document = full_html_document(
+            '<div class="document"></div>', "", "</title><script>alert(1)</script>"
+        )
+        self.assertNotIn(b"<script>", document)
+        self.assertIn(b"&lt;script&gt;", document)
+
+    def test_pdf_document_accepts_non_string_title(self) -> None:
+        for title, rendered in ((None, b"<title>None</title>"), (123, b"<title>123</title>")):
+            document = full_html_document('<div class="document"></div>', "", title)
+            self.assertIn(rendered, document)
+
     def test_generate_pdf_returns_binary_pdf(self) -> None:
         response = self.client.post(
             reverse("editor:pdf"),
@@ -52,4 +122,37 @@ class EditorViewsTests(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response["Content-Type"], "application/pdf")
-        self.assertGreater(len(response.content), 1000)
+        self.assertGreater(len(response.getvalue()), 1000)
+
+    def test_generate_pdf_accepts_numeric_title(self) -> None:
+        payload = dict(self.sample_payload, title=123)
+        response = self.client.post(
+            reverse("editor:pdf"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('filename="123_', response["Content-Disposition"])
+
+    def test_generate_pdf_accepts_unhashable_title(self) -> None:
+        payload = dict(self.sample_payload, title=["제목", "목록"])
+        response = self.client.post(
+            reverse("editor:pdf"),
+            data=json.dumps(payload),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_generate_pdf_returns_304_for_matching_etag(self) -> None:
+        data = json.dumps(self.sample_payload)
+        first = self.client.post(
+            reverse("editor:pdf"), data=data, content_type="application/json"
+        )
+        self.assertEqual(first.status_code, 200)
+        second = self.client.post(
+            reverse("editor:pdf"),
+            data=data,
+            content_type="application/json",
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+        self.assertEqual(second.status_code, 304)
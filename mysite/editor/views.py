@@ -1,24 +1,87 @@
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
 import json
-import textwrap
+import os
+import re
+import threading
+import time
 import unicodedata
-from copy import deepcopy
-from datetime import datetime
-from typing import Any, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from html import escape
+from string import Template
+from typing import Any, NamedTuple
 
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import render
+from django.views.decorators.gzip import gzip_page
 from django.views.decorators.http import require_GET, require_POST
 from markdown_it import MarkdownIt
-from markdown_it.token import Token
-from weasyprint import HTML
+from weasyprint import CSS, HTML, default_url_fetcher
+from weasyprint.text.fonts import FontConfiguration
+
+try:  # pragma: no cover - optional speedup
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # pragma: no cover - optional speedup
+    import regex as _regex_module
+except ImportError:
+    _regex_module = None
+
+if _regex_module is not None:
+    # \X matches a full Unicode extended grapheme cluster in the C engine.
+    _GRAPHEME_RE = _regex_module.compile(r"\X")
+
+    def _split_graphemes(text: str) -> list[str]:
+        return _GRAPHEME_RE.findall(text)
+
+else:
 
+    def _split_graphemes(text: str) -> list[str]:
+        # Pure-Python fallback: unicodedata.combining recognises marks in
+        # every script (Thai, Hebrew, Arabic, Devanagari, ...), which a
+        # fixed character class cannot, so clusters stay intact in those
+        # scripts at the cost of a per-character loop.
+        clusters: list[str] = []
+        buffer = ""
+        for char in text:
+            if not buffer:
+                buffer = char
+                continue
+            if (
+                unicodedata.combining(char)
+                or char == "\u200d"
+                or buffer.endswith("\u200d")
+                or 0xFE00 <= ord(char) <= 0xFE0F
+            ):
+                buffer += char
+                continue
+            clusters.append(buffer)
+            buffer = char
+        if buffer:
+            clusters.append(buffer)
+        return clusters
+
+
+# Shared across threads on purpose: MarkdownIt keeps its configuration in
+# the instance but allocates fresh parse state per render() call, so
+# concurrent previews never contend on it.
 markdown_engine = MarkdownIt(
     "commonmark",
     {"html": True, "linkify": True, "typographer": True},
-)
-
+).enable(["table", "strikethrough"])
 THEME_DEFAULTS: dict[str, Any] = {
     "title": "Untitled",
     "fontFamily": "'Noto Sans KR', 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif",
@@ -58,6 +121,14 @@ _COUNTER_STYLES: dict[str, str] = {
 }
 
 
+_TRUE_WORDS = frozenset({"true", "1", "yes", "on"})
+_FALSE_WORDS = frozenset({"false", "0", "no", "off"})
+
+# Single-pass separator normalization for sequence input: CR, comma, and
+# semicolon all become newlines.
+_SEQUENCE_SEPARATORS = str.maketrans({"\r": "\n", ",": "\n", ";": "\n"})
+
+
 def _boolean_value(value: Any, *, default: bool | None = None) -> bool:
     if value is None:
         return bool(default)
@@ -65,9 +136,9 @@ def _boolean_value(value: Any, *, default: bool | None = None) -> bool:
         return value
     if isinstance(value, str):
         lowered = value.strip().lower()
-        if lowered in {"true", "1", "yes", "on"}:
+        if lowered in _TRUE_WORDS:
             return True
-        if lowered in {"false", "0", "no", "off"}:
+        if lowered in _FALSE_WORDS:
             return False
     if isinstance(value, (int, float)):
         return bool(value)
@@ -88,28 +159,6 @@ def _coerce_float(value: Any, default: float) -> float:
         return default
 
 
-def _split_graphemes(text: str) -> list[str]:
-    clusters: list[str] = []
-    buffer = ""
-    for char in text:
-        if not buffer:
-            buffer = char
-            continue
-        if (
-            unicodedata.combining(char)
-            or char == "\u200d"
-            or buffer.endswith("\u200d")
-            or 0xFE00 <= ord(char) <= 0xFE0F
-        ):
-            buffer += char
-            continue
-        clusters.append(buffer)
-        buffer = char
-    if buffer:
-        clusters.append(buffer)
-    return clusters
-
-
 def _normalize_sequence(value: Any) -> list[str]:
     if value is None:
         return []
@@ -119,7 +168,7 @@ def _normalize_sequence(value: Any) -> list[str]:
         text = value.strip()
         if not text:
             return []
-        normalized = text.replace("\r", "\n").replace(",", "\n").replace(";", "\n")
+        normalized = text.translate(_SEQUENCE_SEPARATORS)
         parts = [part.strip() for part in normalized.split("\n") if part.strip()]
         if not parts:
             return []
@@ -142,13 +191,6 @@ def _normalize_sequence(value: Any) -> list[str]:
     return [str(value)]
 
 
-def _css_string(value: Any) -> str:
-    if value is None:
-        return "''"
-    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
-    return f"'{escaped}'"
-
-
 def _counter_style(name: Any) -> str:
     if not name:
         return "decimal"
@@ -156,7 +198,10 @@ def _counter_style(name: Any) -> str:
     return _COUNTER_STYLES.get(key, "decimal")
 
 
-def _number_to_custom_label(index: int, digits: Sequence[str]) -> str:
+@functools.lru_cache(maxsize=4096)
+def _number_to_custom_label(index: int, digits: tuple[str, ...]) -> str:
+    # Labels for 1..N repeat on every preview of the same document, so the
+    # bijective-numeration loop only runs once per (index, digits) pair.
     if not digits:
         return str(index)
     base = len(digits)
@@ -169,69 +214,112 @@ def _number_to_custom_label(index: int, digits: Sequence[str]) -> str:
     return "".join(reversed(result)) or digits[0]
 
 
-def _apply_custom_lists(tokens: list[Token], theme: dict[str, Any]) -> None:
+# Matches list-structure tags in rendered HTML. Code spans escape angle
+# brackets, so only real markup matches; the regex engine does the
+# tokenization in C and Python only touches the matched positions.
+_LIST_TAG_RE = re.compile(r"<(/?)(ul|ol|li)(\s[^>]*)?>")
+_OL_START_RE = re.compile(r'start="(\d+)"')
+
+
+def _apply_custom_lists(html_body: str, theme: dict[str, Any]) -> str:
+    """Inject custom bullet/ordered marker attributes into rendered HTML.
+
+    Runs as a single stack-based pass over the list tags the regex finds,
+    splicing ``data-bullet-symbol`` / ``data-ordered-label`` attributes into
+    the ``<li>`` open tags of the innermost list, mirroring the CSS hooks in
+    the custom-list fragments.
+    """
     use_custom_bullets = _boolean_value(theme.get("useCustomBullets"))
     use_custom_ordered = _boolean_value(theme.get("useCustomOrdered"))
-    bullet_sequence = [
+    bullet_sequence = tuple(
         str(item) for item in (theme.get("customBulletSequence") or []) if str(item)
-    ]
-    ordered_digits = [
+    )
+    ordered_digits = tuple(
         str(item) for item in (theme.get("customOrderedDigits") or []) if str(item)
-    ]
+    )
+    if not (use_custom_bullets and bullet_sequence) and not (
+        use_custom_ordered and ordered_digits
+    ):
+        return html_body
+
     ordered_prefix = str(theme.get("orderedMarkerPrefix") or "")
     ordered_suffix = str(theme.get("orderedMarkerSuffix") or ".")
 
     stack: list[dict[str, Any]] = []
+    pieces: list[str] = []
+    cursor = 0
 
-    for token in tokens:
-        if token.type == "bullet_list_open":
-            context = {
-                "type": "ul",
-                "index": 0,
-                "sequence": bullet_sequence
-                if use_custom_bullets and bullet_sequence
-                else None,
-            }
-            stack.append(context)
-        elif token.type == "ordered_list_open":
-            start_value = _coerce_int(token.attrGet("start"), 1)
-            context = {
-                "type": "ol",
-                "counter": max(1, start_value),
-                "digits": ordered_digits
-                if use_custom_ordered and ordered_digits
-                else None,
-                "prefix": ordered_prefix,
-                "suffix": ordered_suffix,
-            }
-            stack.append(context)
-        elif token.type in {"bullet_list_close", "ordered_list_close"}:
-            if stack:
-                stack.pop()
-        elif token.type == "list_item_open" and stack:
+    for match in _LIST_TAG_RE.finditer(html_body):
+        closing, tag = match.group(1), match.group(2)
+        if tag == "ul":
+            if closing:
+                if stack:
+                    stack.pop()
+            else:
+                stack.append(
+                    {
+                        "type": "ul",
+                        "index": 0,
+                        "sequence": bullet_sequence
+                        if use_custom_bullets and bullet_sequence
+                        else None,
+                    }
+                )
+        elif tag == "ol":
+            if closing:
+                if stack:
+                    stack.pop()
+            else:
+                start_match = _OL_START_RE.search(match.group(3) or "")
+                start_value = _coerce_int(start_match.group(1), 1) if start_match else 1
+                stack.append(
+                    {
+                        "type": "ol",
+                        "counter": max(1, start_value),
+                        "digits": ordered_digits
+                        if use_custom_ordered and ordered_digits
+                        else None,
+                    }
+                )
+        elif not closing and stack:
             active = stack[-1]
-            if active.get("type") == "ul":
-                sequence: list[str] | None = active.get("sequence")
+            marker_attr: str | None = None
+            if active["type"] == "ul":
+                sequence: tuple[str, ...] | None = active["sequence"]
                 if sequence:
-                    index = active.get("index", 0)
-                    symbol = sequence[index % len(sequence)]
+                    index = active["index"]
                     active["index"] = index + 1
-                    token.attrSet("data-bullet-symbol", str(symbol))
-            elif active.get("type") == "ol":
-                digits: list[str] | None = active.get("digits")
+                    symbol = sequence[index % len(sequence)]
+                    marker_attr = f' data-bullet-symbol="{escape(symbol, quote=True)}"'
+            else:
+                digits: tuple[str, ...] | None = active["digits"]
                 if digits:
-                    counter_value = active.get("counter", 1)
-                    label = _number_to_custom_label(counter_value, digits)
+                    counter_value = active["counter"]
                     active["counter"] = counter_value + 1
-                    token.attrSet(
-                        "data-ordered-label",
-                        f"{active.get('prefix', '')}{label}{active.get('suffix', '')}",
+                    label = _number_to_custom_label(counter_value, digits)
+                    marker_attr = (
+                        ' data-ordered-label="'
+                        f'{escape(f"{ordered_prefix}{label}{ordered_suffix}", quote=True)}"'
                     )
+            if marker_attr is not None:
+                # Splice the attribute in just before the closing '>'.
+                pieces.append(html_body[cursor : match.end() - 1])
+                pieces.append(marker_attr)
+                pieces.append(">")
+                cursor = match.end()
+
+    if not pieces:
+        return html_body
+    pieces.append(html_body[cursor:])
+    return "".join(pieces)
 
 
 def merge_theme(user_theme: dict[str, Any] | None) -> dict[str, Any]:
     theme_input = user_theme or {}
-    result = deepcopy(THEME_DEFAULTS)
+    # Shallow copy is enough: the only mutable defaults are the two sequence
+    # lists, which are never mutated in place — user-supplied values rebind
+    # them below via _normalize_sequence.
+    result = THEME_DEFAULTS.copy()
 
     for key, value in theme_input.items():
         if key in {"customBulletSequence", "customOrderedDigits"}:
@@ -278,209 +366,393 @@ def merge_theme(user_theme: dict[str, Any] | None) -> dict[str, Any]:
     return result
 
 
-def build_theme_css(theme: dict[str, Any]) -> str:
-    font_size_px = _coerce_int(theme.get("baseFontSize"), 16)
-    line_height = _coerce_float(theme.get("lineHeight"), 1.7)
-    page_padding = str(theme.get("pagePadding") or "48px")
-    list_style = str(theme.get("listStyle") or "disc")
-    ordered_style = _counter_style(theme.get("orderedListStyle"))
+_CSS_CORE_TEMPLATE = Template("""
+:root {
+    color-scheme: light;
+}
+body {
+    margin: 0;
+    padding: 0;
+    background: $background_color;
+    color: $text_color;
+    font-family: 'Noto Sans KR', 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif;
+    font-size: ${font_size_px}px;
+    line-height: $line_height;
+    -webkit-font-smoothing: antialiased;
+}
+.document {
+    width: 100%;
+    margin: 0;
+    background: $background_color;
+    padding: $page_padding;
+    box-shadow: $card_shadow;
+    border-radius: 20px;
+    border: 1px solid rgba(15, 23, 42, 0.08);
+    font-family: $font_family;
+    box-sizing: border-box;
+}
+.document p {
+    margin: 0.75em 0;
+}
+.document strong {
+    font-weight: 700;
+}
+""")
+
+_CSS_HEADING_TEMPLATE = Template("""
+.document h1,
+.document h2,
+.document h3,
+.document h4,
+.document h5 {
+    color: $heading_color;
+    margin-top: 1.6em;
+    margin-bottom: 0.6em;
+    font-weight: 700;
+}
+.document h1 { font-size: 1.9em; }
+.document h2 { font-size: 1.6em; }
+.document h3 { font-size: 1.35em; }
+""")
+
+_CSS_LINK_TEMPLATE = Template("""
+.document a {
+    color: $accent_color;
+    text-decoration: none;
+}
+.document a:hover {
+    text-decoration: underline;
+}
+""")
+
+_CSS_BULLET_LIST_TEMPLATE = Template("""
+.document ul {
+    list-style: $list_style;
+    padding-left: 1.55em;
+    margin: 0.6em 0;
+}
+""")
+
+_CSS_ORDERED_LIST_TEMPLATE = Template("""
+.document ol {
+    list-style: $ordered_style;
+    padding-left: 1.85em;
+    margin: 0.6em 0;
+}
+""")
+
+# Fully static fragments: no theme placeholders, built once at import and
+# appended as-is.
+_CSS_LIST_ITEM = """
+.document li {
+    margin: 0.35em 0;
+}
+"""
+
+_CSS_BLOCKQUOTE_TEMPLATE = Template("""
+.document blockquote {
+    margin: 1.4em 0;
+    padding: 1.1em 1.4em;
+    background: $blockquote_background;
+    border-left: 4px solid $blockquote_border_color;
+    color: $blockquote_text_color;
+    border-radius: $blockquote_border_radius;
+}
+""")
+
+_CSS_CODE_TEMPLATE = Template("""
+.document code {
+    background: $code_background;
+    color: $code_text_color;
+    padding: 0.2em 0.45em;
+    border-radius: 8px;
+    font-family: 'Fira Code', 'Cascadia Code', Consolas, monospace;
+    font-size: 0.92em;
+}
+.document pre code {
+    display: block;
+    padding: 1.2em 1.4em;
+    overflow-x: auto;
+    border-radius: 16px;
+}
+""")
+
+_CSS_TABLE = """
+.document table {
+    border-collapse: collapse;
+    width: 100%;
+    margin: 1.5em 0;
+}
+.document th,
+.document td {
+    border: 1px solid rgba(15, 23, 42, 0.12);
+    padding: 0.6em 0.8em;
+    text-align: left;
+}
+"""
+
+_CSS_HR = """
+.document hr {
+    border: none;
+    border-top: 1px solid rgba(15, 23, 42, 0.12);
+    margin: 2em 0;
+}
+"""
+
+_CUSTOM_BULLET_CSS_TEMPLATE = Template("""
+.document--custom-bullets ul {
+    list-style: none;
+    margin: 0.6em 0;
+    padding-left: 0;
+}
+.document--custom-bullets ul ul {
+    margin-left: 1.6em;
+}
+.document--custom-bullets li[data-bullet-symbol] {
+    position: relative;
+    padding-left: 1.9em;
+}
+.document--custom-bullets li[data-bullet-symbol]::before {
+    content: attr(data-bullet-symbol);
+    position: absolute;
+    left: 0;
+    top: 0.1em;
+    font-weight: 600;
+    color: $accent_color;
+    font-size: 1em;
+    line-height: 1.2;
+}
+""")
+
+_CUSTOM_ORDERED_CSS_TEMPLATE = Template("""
+.document--custom-ordered ol {
+    list-style: none;
+    margin: 0.6em 0;
+    padding-left: 0;
+}
+.document--custom-ordered ol ol {
+    margin-left: 2em;
+}
+.document--custom-ordered li[data-ordered-label] {
+    position: relative;
+    padding-left: 2.6em;
+}
+.document--custom-ordered li[data-ordered-label]::before {
+    content: attr(data-ordered-label);
+    position: absolute;
+    left: 0;
+    top: 0.05em;
+    font-weight: 700;
+    color: $accent_color;
+    font-size: 1em;
+    line-height: 1.2;
+    min-width: 2em;
+    text-align: right;
+    display: inline-block;
+}
+""")
+
+
+# Collapses indentation and blank lines; CSS string values in the emitted
+# stylesheet never span lines, so this is safe without a CSS parser.
+_CSS_WHITESPACE_RE = re.compile(r"\n[ \t]*")
+
+_HEADING_TAG_RE = re.compile(r"<h[1-6]")
+
+_CSS_FEATURE_TAGS: tuple[tuple[str, str], ...] = (
+    ("link", "<a"),
+    ("bullet_list", "<ul"),
+    ("ordered_list", "<ol"),
+    ("blockquote", "<blockquote"),
+    ("code", "<code"),
+    ("table", "<table"),
+    ("hr", "<hr"),
+)
+
+_ALL_CSS_FEATURES = frozenset(
+    {"heading", *(name for name, _ in _CSS_FEATURE_TAGS)}
+)
+
+
+def _detect_css_features(html_body: str) -> frozenset[str]:
+    features = {name for name, tag in _CSS_FEATURE_TAGS if tag in html_body}
+    if _HEADING_TAG_RE.search(html_body):
+        features.add("heading")
+    return frozenset(features)
+
+
+@functools.lru_cache(maxsize=128)
+def _css_plan(
+    features: frozenset[str], use_custom_bullets: bool, use_custom_ordered: bool
+) -> tuple[tuple[Template | str, bool], ...]:
+    """Ordered (fragment, is_static) plan for a document/theme shape.
+
+    The shape — which element groups appear plus the two custom-list flags —
+    recurs far more often than full theme fingerprints, so the conditional
+    fragment selection runs once per shape instead of per stylesheet build.
+    """
+    plan: list[tuple[str, bool]] = [(_CSS_CORE_TEMPLATE, False)]
+
+    if "heading" in features:
+        plan.append((_CSS_HEADING_TEMPLATE, False))
+    if "link" in features:
+        plan.append((_CSS_LINK_TEMPLATE, False))
+    if "bullet_list" in features:
+        plan.append((_CSS_BULLET_LIST_TEMPLATE, False))
+    if "ordered_list" in features:
+        plan.append((_CSS_ORDERED_LIST_TEMPLATE, False))
+    if "bullet_list" in features or "ordered_list" in features:
+        plan.append((_CSS_LIST_ITEM, True))
+    if "blockquote" in features:
+        plan.append((_CSS_BLOCKQUOTE_TEMPLATE, False))
+    if "code" in features:
+        plan.append((_CSS_CODE_TEMPLATE, False))
+    if "table" in features:
+        plan.append((_CSS_TABLE, True))
+    if "hr" in features:
+        plan.append((_CSS_HR, True))
+    if use_custom_bullets and "bullet_list" in features:
+        plan.append((_CUSTOM_BULLET_CSS_TEMPLATE, False))
+    if use_custom_ordered and "ordered_list" in features:
+        plan.append((_CUSTOM_ORDERED_CSS_TEMPLATE, False))
+
+    return tuple(plan)
+
+
+class _ResolvedTheme(NamedTuple):
+    """CSS-relevant theme values, coerced once and hashable for caching."""
+
+    features: frozenset[str]
+    background_color: str
+    text_color: str
+    heading_color: str
+    accent_color: str
+    font_family: str
+    font_size_px: int
+    line_height: float
+    page_padding: str
+    card_shadow: str
+    list_style: str
+    ordered_style: str
+    blockquote_background: str
+    blockquote_border_color: str
+    blockquote_text_color: str
+    blockquote_border_radius: str
+    code_background: str
+    code_text_color: str
+    use_custom_bullets: bool
+    use_custom_ordered: bool
+
+
+@functools.lru_cache(maxsize=256)
+def _build_theme_css_cached(resolved: _ResolvedTheme) -> str:
+    # Template.substitute ignores the non-CSS fields in the mapping.
+    values = resolved._asdict()
+    plan = _css_plan(
+        resolved.features, resolved.use_custom_bullets, resolved.use_custom_ordered
+    )
+    css_parts = [
+        fragment if is_static else fragment.substitute(values)
+        for fragment, is_static in plan
+    ]
+    return _CSS_WHITESPACE_RE.sub("\n", "".join(css_parts)).strip()
+
+
+def _custom_list_flags(theme: dict[str, Any]) -> tuple[bool, bool]:
+    """Resolve the custom bullet/ordered switches from a theme dict once."""
     use_custom_bullets = _boolean_value(theme.get("useCustomBullets")) and bool(
         theme.get("customBulletSequence")
     )
     use_custom_ordered = _boolean_value(theme.get("useCustomOrdered")) and bool(
         theme.get("customOrderedDigits")
     )
+    return use_custom_bullets, use_custom_ordered
 
-    base_css = textwrap.dedent(
-        f"""
-        :root {{
-            color-scheme: light;
-        }}
-        body {{
-            margin: 0;
-            padding: 0;
-            background: {theme["backgroundColor"]};
-            color: {theme["textColor"]};
-            font-family: 'Noto Sans KR', 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif;
-            font-size: {font_size_px}px;
-            line-height: {line_height};
-            -webkit-font-smoothing: antialiased;
-        }}
-        .document {{
-            width: 100%;
-            margin: 0;
-            background: {theme["backgroundColor"]};
-            padding: {page_padding};
-            box-shadow: {theme["cardShadow"]};
-            border-radius: 20px;
-            border: 1px solid rgba(15, 23, 42, 0.08);
-            font-family: {theme["fontFamily"]};
-            box-sizing: border-box;
-        }}
-        .document h1,
-        .document h2,
-        .document h3,
-        .document h4,
-        .document h5 {{
-            color: {theme["headingColor"]};
-            margin-top: 1.6em;
-            margin-bottom: 0.6em;
-            font-weight: 700;
-        }}
-        .document h1 {{ font-size: 1.9em; }}
-        .document h2 {{ font-size: 1.6em; }}
-        .document h3 {{ font-size: 1.35em; }}
-        .document p {{
-            margin: 0.75em 0;
-        }}
-        .document a {{
-            color: {theme["accentColor"]};
-            text-decoration: none;
-        }}
-        .document a:hover {{
-            text-decoration: underline;
-        }}
-        .document ul {{
-            list-style: {list_style};
-            padding-left: 1.55em;
-            margin: 0.6em 0;
-        }}
-        .document ol {{
-            list-style: {ordered_style};
-            padding-left: 1.85em;
-            margin: 0.6em 0;
-        }}
-        .document li {{
-            margin: 0.35em 0;
-        }}
-        .document blockquote {{
-            margin: 1.4em 0;
-            padding: 1.1em 1.4em;
-            background: {theme["blockquoteBackground"]};
-            border-left: 4px solid {theme["blockquoteBorderColor"]};
-            color: {theme["blockquoteTextColor"]};
-            border-radius: {theme["blockquoteBorderRadius"]};
-        }}
-        .document code {{
-            background: {theme["codeBackground"]};
-            color: {theme["codeTextColor"]};
-            padding: 0.2em 0.45em;
-            border-radius: 8px;
-            font-family: 'Fira Code', 'Cascadia Code', Consolas, monospace;
-            font-size: 0.92em;
-        }}
-        .document pre code {{
-            display: block;
-            padding: 1.2em 1.4em;
-            overflow-x: auto;
-            border-radius: 16px;
-        }}
-        .document table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin: 1.5em 0;
-        }}
-        .document th,
-        .document td {{
-            border: 1px solid rgba(15, 23, 42, 0.12);
-            padding: 0.6em 0.8em;
-            text-align: left;
-        }}
-        .document hr {{
-            border: none;
-            border-top: 1px solid rgba(15, 23, 42, 0.12);
-            margin: 2em 0;
-        }}
-        .document strong {{
-            font-weight: 700;
-        }}
-        """
+
+def build_theme_css(
+    theme: dict[str, Any],
+    features: frozenset[str] | None = None,
+    *,
+    use_custom_bullets: bool | None = None,
+    use_custom_ordered: bool | None = None,
+) -> str:
+    if use_custom_bullets is None or use_custom_ordered is None:
+        use_custom_bullets, use_custom_ordered = _custom_list_flags(theme)
+
+    resolved = _ResolvedTheme(
+        features=_ALL_CSS_FEATURES if features is None else features,
+        background_color=str(theme["backgroundColor"]),
+        text_color=str(theme["textColor"]),
+        heading_color=str(theme["headingColor"]),
+        accent_color=str(theme["accentColor"]),
+        font_family=str(theme["fontFamily"]),
+        font_size_px=_coerce_int(theme.get("baseFontSize"), 16),
+        line_height=_coerce_float(theme.get("lineHeight"), 1.7),
+        page_padding=str(theme.get("pagePadding") or "48px"),
+        card_shadow=str(theme["cardShadow"]),
+        list_style=str(theme.get("listStyle") or "disc"),
+        ordered_style=_counter_style(theme.get("orderedListStyle")),
+        blockquote_background=str(theme["blockquoteBackground"]),
+        blockquote_border_color=str(theme["blockquoteBorderColor"]),
+        blockquote_text_color=str(theme["blockquoteTextColor"]),
+        blockquote_border_radius=str(theme["blockquoteBorderRadius"]),
+        code_background=str(theme["codeBackground"]),
+        code_text_color=str(theme["codeTextColor"]),
+        use_custom_bullets=use_custom_bullets,
+        use_custom_ordered=use_custom_ordered,
     )
+    return _build_theme_css_cached(resolved)
 
-    css_parts = [base_css]
 
-    if use_custom_bullets:
-        css_parts.append(
-            textwrap.dedent(
-                f"""
-                .document--custom-bullets ul {{
-                    list-style: none;
-                    margin: 0.6em 0;
-                    padding-left: 0;
-                }}
-                .document--custom-bullets ul ul {{
-                    margin-left: 1.6em;
-                }}
-                .document--custom-bullets li[data-bullet-symbol] {{
-                    position: relative;
-                    padding-left: 1.9em;
-                }}
-                .document--custom-bullets li[data-bullet-symbol]::before {{
-                    content: attr(data-bullet-symbol);
-                    position: absolute;
-                    left: 0;
-                    top: 0.1em;
-                    font-weight: 600;
-                    color: {theme["accentColor"]};
-                    font-family: {theme["fontFamily"]};
-                    font-size: 1em;
-                    line-height: 1.2;
-                }}
-                """
-            )
-        )
+@functools.lru_cache(maxsize=64)
+def _render_markdown_body(markdown_text: str) -> str:
+    """Rendered HTML for a markdown document, memoized across requests.
 
-    if use_custom_ordered:
-        css_parts.append(
-            textwrap.dedent(
-                f"""
-                .document--custom-ordered ol {{
-                    list-style: none;
-                    margin: 0.6em 0;
-                    padding-left: 0;
-                }}
-                .document--custom-ordered ol ol {{
-                    margin-left: 2em;
-                }}
-                .document--custom-ordered li[data-ordered-label] {{
-                    position: relative;
-                    padding-left: 2.6em;
-                }}
-                .document--custom-ordered li[data-ordered-label]::before {{
-                    content: attr(data-ordered-label);
-                    position: absolute;
-                    left: 0;
-                    top: 0.05em;
-                    font-weight: 700;
-                    color: {theme["accentColor"]};
-                    font-family: {theme["fontFamily"]};
-                    font-size: 1em;
-                    line-height: 1.2;
-                    min-width: 2em;
-                    text-align: right;
-                    display: inline-block;
-                }}
-                """
-            )
-        )
+    Live previews resend near-identical markdown on every keystroke and
+    frequently revisit prior states (undo, debounce retries), so document-
+    level memoization removes the parse entirely for repeats. Finer-grained
+    block caching was deliberately avoided: splitting on blank lines is not
+    sound for CommonMark (fenced code blocks may span them).
+    """
+    return markdown_engine.render(markdown_text)
 
-    css = "\n".join(css_parts)
-    return "\n".join(line.rstrip() for line in css.splitlines())
+
+def _content_cache_key(markdown_text: str, theme: dict[str, Any]) -> bytes:
+    """Digest identifying a (markdown, theme) pair, shared by the render and
+    PDF caches."""
+    payload = (
+        markdown_text.encode("utf-8")
+        + b"\0"
+        + json.dumps(theme, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    )
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+# Finished (document_html, css) pairs keyed by content digest: a preview that
+# repeats a prior (markdown, theme) state skips everything, including feature
+# detection and the custom-list pass.
+_RENDER_CACHE: OrderedDict[bytes, tuple[str, str]] = OrderedDict()
+_RENDER_CACHE_MAX_ENTRIES = 128
+_render_cache_lock = threading.Lock()
 
 
 def render_markdown(markdown_text: str, theme: dict[str, Any]) -> tuple[str, str]:
-    tokens = markdown_engine.parse(markdown_text or "")
-    use_custom_bullets = _boolean_value(theme.get("useCustomBullets")) and bool(
-        theme.get("customBulletSequence")
-    )
-    use_custom_ordered = _boolean_value(theme.get("useCustomOrdered")) and bool(
-        theme.get("customOrderedDigits")
-    )
+    if not markdown_text:
+        return '<div class="document"></div>', build_theme_css(theme, frozenset())
+
+    cache_key = _content_cache_key(markdown_text, theme)
+    with _render_cache_lock:
+        cached = _RENDER_CACHE.get(cache_key)
+        if cached is not None:
+            _RENDER_CACHE.move_to_end(cache_key)
+            return cached
 
+    use_custom_bullets, use_custom_ordered = _custom_list_flags(theme)
+
+    html_body = _render_markdown_body(markdown_text)
     if use_custom_bullets or use_custom_ordered:
-        _apply_custom_lists(tokens, theme)
+        html_body = _apply_custom_lists(html_body, theme)
 
-    html_body = markdown_engine.renderer.render(tokens, markdown_engine.options, {})
     document_classes = ["document"]
     if use_custom_bullets:
         document_classes.append("document--custom-bullets")
@@ -489,41 +761,76 @@ def render_markdown(markdown_text: str, theme: dict[str, Any]) -> tuple[str, str
 
     class_attr = " ".join(document_classes)
     document_html = f'<div class="{class_attr}">{html_body}</div>'
-    css = build_theme_css(theme)
+    css = build_theme_css(
+        theme,
+        _detect_css_features(html_body),
+        use_custom_bullets=use_custom_bullets,
+        use_custom_ordered=use_custom_ordered,
+    )
+
+    with _render_cache_lock:
+        _RENDER_CACHE[cache_key] = (document_html, css)
+        _RENDER_CACHE.move_to_end(cache_key)
+        while len(_RENDER_CACHE) > _RENDER_CACHE_MAX_ENTRIES:
+            _RENDER_CACHE.popitem(last=False)
+
     return document_html, css
 
 
-def full_html_document(document_html: str, css: str, title: str) -> str:
-    return f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="utf-8" />
-    <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-    <title>{title}</title>
-    <style>{css}</style>
-</head>
-<body>
-    {document_html}
-</body>
-</html>
-"""
+# Skeleton of the standalone document, pre-encoded once so assembling a PDF
+# input is a join of byte fragments instead of a per-request f-string build.
+_DOC_PREFIX = (
+    b"<!DOCTYPE html>\n"
+    b'<html lang="ko">\n'
+    b"<head>\n"
+    b'    <meta charset="utf-8" />\n'
+    b'    <meta name="viewport" content="width=device-width, initial-scale=1.0" />\n'
+    b"    <title>"
+)
+_DOC_MID = b"</title>\n    <style>"
+_DOC_POST_STYLE = b"</style>\n</head>\n<body>\n    "
+_DOC_SUFFIX = b"\n</body>\n</html>\n"
+
+
+@functools.lru_cache(maxsize=32)
+def full_html_document(document_html: str, css: str, title: Any) -> bytes:
+    # Repeat PDF exports of an unchanged document reuse the assembled bytes;
+    # the markdown/CSS inputs already come from the shared render cache.
+    return b"".join(
+        (
+            _DOC_PREFIX,
+            escape(str(title), quote=True).encode("utf-8"),
+            _DOC_MID,
+            css.encode("utf-8"),
+            _DOC_POST_STYLE,
+            document_html.encode("utf-8"),
+            _DOC_SUFFIX,
+        )
+    )
+
+
+# THEME_DEFAULTS is immutable module state, so its JSON form is computed once
+# instead of per page load. The template still escapes it via |escapejs.
+_DEFAULT_THEME_JSON = json.dumps(THEME_DEFAULTS, ensure_ascii=False)
 
 
 @require_GET
 def editor_workspace(request: HttpRequest) -> HttpResponse:
     context = {
-        "default_theme": json.dumps(THEME_DEFAULTS, ensure_ascii=False),
+        "default_theme": _DEFAULT_THEME_JSON,
     }
     return render(request, "editor/editor.html", context)
 
 
 def _deserialize_payload(request: HttpRequest) -> tuple[str, dict[str, Any]]:
+    # Both parsers take the raw bytes directly; no intermediate str copy of
+    # the (potentially large) markdown payload is materialized.
     try:
-        payload = json.loads(request.body.decode("utf-8"))
-    except (
-        json.JSONDecodeError,
-        UnicodeDecodeError,
-    ) as exc:  # pragma: no cover - handled upstream
+        if orjson is not None:
+            payload = orjson.loads(request.body)
+        else:
+            payload = json.loads(request.body)
+    except ValueError as exc:  # orjson.JSONDecodeError subclasses ValueError
         raise ValueError("요청 본문이 JSON 형식이 아닙니다.") from exc
 
     markdown_text = payload.get("markdown", "")
@@ -536,40 +843,215 @@ def _json_error(message: str, *, status: int = 400) -> JsonResponse:
     return JsonResponse({"error": message}, status=status)
 
 
+def _json_response(payload: dict[str, Any]) -> HttpResponse:
+    # orjson serializes straight to the bytes Django writes to the socket;
+    # JsonResponse would go through the slower stdlib encoder and an extra
+    # str round-trip.
+    if orjson is not None:
+        return HttpResponse(orjson.dumps(payload), content_type="application/json")
+    return JsonResponse(payload)
+
+
+@gzip_page
 @require_POST
-def live_preview(request: HttpRequest) -> JsonResponse:
+def live_preview(request: HttpRequest) -> HttpResponse:
+    # The response is a pure function of the request body, so a digest of
+    # the raw bytes is a valid strong ETag: a client that resends the same
+    # payload with If-None-Match skips JSON decoding and rendering entirely.
+    etag = f'"{hashlib.blake2b(request.body, digest_size=16).hexdigest()}"'
+    # gzip_page downgrades the ETag to W/"..." on compressed responses,
+    # so strip a weak prefix before comparing.
+    if request.META.get("HTTP_IF_NONE_MATCH", "").removeprefix("W/") == etag:
+        return HttpResponse(status=304)
+
     try:
         markdown_text, theme = _deserialize_payload(request)
     except ValueError as exc:
         return _json_error(str(exc))
 
     document_html, css = render_markdown(markdown_text, theme)
-    return JsonResponse(
+    response = _json_response(
         {
             "html": document_html,
             "css": css,
             "title": theme.get("title", "Untitled"),
         }
     )
+    response["ETag"] = etag
+    return response
+
+
+# WeasyPrint setup shared across requests: font discovery runs once instead
+# of per render, and fetched resources / decoded images are reused.
+_FONT_CONFIG = FontConfiguration()
+_IMAGE_CACHE: dict[str, Any] = {}
+_URL_FETCH_CACHE: dict[str, dict[str, Any]] = {}
+_URL_FETCH_CACHE_MAX_ENTRIES = 64
+
+
+def _caching_url_fetcher(url: str, *args: Any, **kwargs: Any) -> dict[str, Any]:
+    cached = _URL_FETCH_CACHE.get(url)
+    if cached is not None:
+        return dict(cached)
+
+    result = default_url_fetcher(url, *args, **kwargs)
+    file_obj = result.pop("file_obj", None)
+    if file_obj is not None:
+        result["string"] = file_obj.read()
+        file_obj.close()
+
+    if len(_URL_FETCH_CACHE) >= _URL_FETCH_CACHE_MAX_ENTRIES:
+        _URL_FETCH_CACHE.clear()
+    _URL_FETCH_CACHE[url] = result
+    return dict(result)
+
+
+# WeasyPrint is CPU-bound and holds the worker for the whole render, so PDFs
+# are produced in a process pool: concurrent downloads scale with CPU count
+# instead of serializing behind one request thread. The pool is created
+# lazily so management commands never spawn workers.
+_pdf_executor: ProcessPoolExecutor | None = None
+_pdf_executor_lock = threading.Lock()
+
+
+def _reset_pdf_executor() -> None:
+    # A broken pool rejects every later submit, so discard it and let the
+    # next request spawn a fresh one.
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is not None:
+            _pdf_executor.shutdown(wait=False, cancel_futures=True)
+            _pdf_executor = None
+
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    global _pdf_executor
+    if _pdf_executor is None:
+        with _pdf_executor_lock:
+            if _pdf_executor is None:
+                max_workers = (
+                    getattr(settings, "PDF_RENDER_WORKERS", None)
+                    or os.cpu_count()
+                    or 1
+                )
+                _pdf_executor = ProcessPoolExecutor(max_workers=max_workers)
+    return _pdf_executor
+
+
+@functools.lru_cache(maxsize=32)
+def _parsed_stylesheet(css: str) -> CSS:
+    # Theme stylesheets repeat across exports; keeping them as parsed CSS
+    # objects lets write_pdf skip the stylesheet parse on warm renders.
+    return CSS(string=css, font_config=_FONT_CONFIG)
+
+
+def _render_pdf_bytes(html_document: bytes, css: str, base_url: str) -> bytes:
+    return HTML(
+        file_obj=io.BytesIO(html_document),
+        base_url=base_url,
+        url_fetcher=_caching_url_fetcher,
+    ).write_pdf(
+        stylesheets=[_parsed_stylesheet(css)],
+        font_config=_FONT_CONFIG,
+        optimize_images=True,
+        cache=_IMAGE_CACHE,
+    )
+
+
+# Characters that would break (or abuse) the Content-Disposition header or a
+# filesystem path are mapped to underscores in one translate pass.
+_FILENAME_SAFE = str.maketrans({c: "_" for c in ' \t\n\r/\\:*?"<>|'})
+
+
+# Rendered PDFs are cached by (markdown, theme) so repeat downloads of the
+# same document skip WeasyPrint entirely. The cache is bounded by total byte
+# size rather than entry count because PDFs can be MB-scale.
+_PDF_CACHE: OrderedDict[bytes, bytes] = OrderedDict()
+_PDF_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_PDF_CACHE_MIN_SECONDS = 0.05
+_pdf_cache_lock = threading.Lock()
+
+
+def _pdf_cache_get(key: bytes) -> bytes | None:
+    with _pdf_cache_lock:
+        pdf_bytes = _PDF_CACHE.get(key)
+        if pdf_bytes is not None:
+            _PDF_CACHE.move_to_end(key)
+        return pdf_bytes
+
+
+def _pdf_cache_put(key: bytes, pdf_bytes: bytes) -> None:
+    if len(pdf_bytes) > _PDF_CACHE_MAX_BYTES:
+        return
+    with _pdf_cache_lock:
+        _PDF_CACHE[key] = pdf_bytes
+        _PDF_CACHE.move_to_end(key)
+        total = sum(len(item) for item in _PDF_CACHE.values())
+        while total > _PDF_CACHE_MAX_BYTES:
+            _, evicted = _PDF_CACHE.popitem(last=False)
+            total -= len(evicted)
+
+
+_PDF_STREAM_CHUNK = 64 * 1024
+
+
+def _iter_pdf_chunks(pdf_bytes: bytes):
+    # memoryview slices avoid copying the document while it streams out.
+    view = memoryview(pdf_bytes)
+    for start in range(0, len(view), _PDF_STREAM_CHUNK):
+        yield bytes(view[start : start + _PDF_STREAM_CHUNK])
 
 
 @require_POST
 def generate_pdf(request: HttpRequest) -> HttpResponse:
+    # The PDF is deterministic in the request body, so its digest is a
+    # content address: a client revalidating an earlier download gets 304
+    # without touching JSON decoding or the render pipeline.
+    etag = f'"{hashlib.blake2b(request.body, digest_size=8).hexdigest()}"'
+    if request.META.get("HTTP_IF_NONE_MATCH", "").removeprefix("W/") == etag:
+        return HttpResponse(status=304)
+
     try:
         markdown_text, theme = _deserialize_payload(request)
     except ValueError as exc:
         return _json_error(str(exc))
 
-    document_html, css = render_markdown(markdown_text, theme)
-    html_document = full_html_document(
-        document_html, css, theme.get("title", "Untitled")
-    )
-    base_url = request.build_absolute_uri("/")
-    pdf_bytes = HTML(string=html_document, base_url=base_url).write_pdf()
+    cache_key = _content_cache_key(markdown_text, theme)
+    pdf_bytes = _pdf_cache_get(cache_key)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{theme.get('title', 'Document')}_{timestamp}.pdf"
+    if pdf_bytes is None:
+        document_html, css = render_markdown(markdown_text, theme)
+        # The CSS travels separately so the worker can reuse a parsed
+        # stylesheet instead of reparsing an inline <style> block.
+        # str() before the call: lru_cache hashes its arguments, so an
+        # unhashable JSON title (list/object) must not cross the boundary.
+        html_document = full_html_document(
+            document_html, "", str(theme.get("title", "Untitled"))
+        )
+        base_url = request.build_absolute_uri("/")
+        started = time.perf_counter()
+        try:
+            future = _get_pdf_executor().submit(
+                _render_pdf_bytes, html_document, css, base_url
+            )
+            pdf_bytes = future.result()
+        except BrokenProcessPool:
+            # A crashed worker should not take PDF export down with it.
+            _reset_pdf_executor()
+            pdf_bytes = _render_pdf_bytes(html_document, css, base_url)
+        # Caching a render that was nearly free would only waste the budget.
+        if time.perf_counter() - started >= _PDF_CACHE_MIN_SECONDS:
+            _pdf_cache_put(cache_key, pdf_bytes)
 
-    response = HttpResponse(pdf_bytes, content_type="application/pdf")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    safe_title = str(theme.get("title") or "Document").translate(_FILENAME_SAFE)[:80]
+    filename = f"{safe_title}_{timestamp}.pdf"
+
+    response = StreamingHttpResponse(
+        _iter_pdf_chunks(pdf_bytes), content_type="application/pdf"
+    )
+    response["Content-Length"] = str(len(pdf_bytes))
     response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, max-age=31536000, immutable"
     return response
@@ -120,6 +120,13 @@ USE_TZ = True
 
 STATIC_URL = "static/"
 
+# PDF rendering
+
+# Size of the WeasyPrint worker pool each web process spawns.
+# None means one worker per CPU core; lower it when running several
+# web processes on the same machine.
+PDF_RENDER_WORKERS: int | None = None
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 